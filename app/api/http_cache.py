@@ -0,0 +1,127 @@
+# app/api/http_cache.py
+
+import gzip
+import hashlib
+import json
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+# Bump to invalidate every ETag handed out by earlier releases
+ETAG_VERSION = "1"
+
+
+def compute_etag(endpoint: str, tickers: list[str], last_bar: str, params: dict) -> str:
+    """
+    Weak ETag from everything a market-data response depends on.
+
+    Weak because the same representation may be sent gzip / brotli encoded.
+    """
+    raw = json.dumps(
+        [ETAG_VERSION, settings.market_data_provider, endpoint,
+         sorted(set(tickers)), last_bar, params],
+        sort_keys=True,
+        default=str,
+    )
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    True if the request's If-None-Match matches etag (weak comparison).
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def seconds_until_next_bar(now: datetime | None = None) -> int:
+    """
+    Seconds until the next daily bar is expected (weekdays at MT_DAILY_BAR_TIME).
+    """
+    tz = ZoneInfo(settings.market_timezone)
+    now = now.astimezone(tz) if now else datetime.now(tz)
+    bar_time = time.fromisoformat(settings.daily_bar_time)
+
+    expires = datetime.combine(now.date(), bar_time, tzinfo=tz)
+    if expires <= now:
+        expires += timedelta(days=1)
+    while expires.weekday() >= 5:
+        expires += timedelta(days=1)
+
+    # Timestamps, not datetime subtraction: same-tzinfo arithmetic ignores DST changes
+    return max(0, int(expires.timestamp() - now.timestamp()))
+
+
+def seconds_until_cache_rollover(now: datetime | None = None) -> int:
+    """
+    Seconds until the server's local date changes.
+
+    Panels and signals are cached under datetime.now().date(), so a new bar
+    is only picked up once that date rolls over.
+    """
+    now = now.astimezone() if now else datetime.now().astimezone()
+    # Naive local midnight: timestamp() resolves it in the server's time zone
+    midnight = datetime.combine(now.date() + timedelta(days=1), time())
+    return max(0, int(midnight.timestamp() - now.timestamp()))
+
+
+def max_age(now: datetime | None = None) -> int:
+    """
+    Freshness lifetime: until the next bar, but never past the moment the
+    server itself would reload data that includes it.
+    """
+    now = now or datetime.now().astimezone()
+    return min(seconds_until_next_bar(now), seconds_until_cache_rollover(now))
+
+
+def cache_headers(etag: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={max_age()}",
+        "Vary": "Accept-Encoding",
+    }
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers=cache_headers(etag))
+
+
+def cached_json(request: Request, payload, etag: str, headers: dict[str, str] | None = None) -> Response:
+    """
+    JSON response with caching headers, compressed when large enough.
+
+    Uses brotli if the client accepts it and the package is installed,
+    otherwise gzip.
+    """
+    body = json.dumps(jsonable_encoder(payload), separators=(",", ":")).encode()
+
+    response_headers = {**(headers or {}), **cache_headers(etag)}
+
+    if len(body) >= settings.compress_min_bytes:
+        accepted = {
+            enc.split(";")[0].strip().lower()
+            for enc in request.headers.get("accept-encoding", "").split(",")
+        }
+        if brotli is not None and "br" in accepted:
+            body = brotli.compress(body, quality=4)
+            response_headers["Content-Encoding"] = "br"
+        elif "gzip" in accepted:
+            body = gzip.compress(body, compresslevel=5)
+            response_headers["Content-Encoding"] = "gzip"
+
+    return Response(body, media_type="application/json", headers=response_headers)
@@ -1,25 +1,30 @@
 # app/api/routes.py
-import pandas as pd
-import numpy as np
-from fastapi import APIRouter, Query
+#
+# pandas, numpy, yfinance and the analytics modules are imported inside the
+# handlers so that importing app.main stays cheap; the first call pays for
+# them (or the startup warm-up does, see app/services/warmup.py).
+from typing import TYPE_CHECKING, Literal
+
+from fastapi import APIRouter, Query, Request, Response
 from datetime import datetime
 
-from app.services.market_data import MarketDataService
-from app.services.analytics.returns import DailyReturnsAnalyzer
-from app.services.analytics.monte_carlo import MonteCarloSimulator
-from app.services.signal.confidence import SignalConfidenceCalculator
-from app.services.signal.ranking import SignalRanker
+from app.api.http_cache import cached_json, compute_etag, is_not_modified, not_modified
 from app.api.schemas import SignalsResponse, SignalMetrics
-from app.services.analytics.price import PriceAnalytics
+from app.services.scheduler import SimulationPlan, scheduler
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 router = APIRouter()
 
-def to_json_safe(series: pd.Series) -> list:
+def to_json_safe(series: "pd.Series") -> list:
     """
     Convert pandas Series to JSON-safe Python list:
     - NaN / +inf / -inf → None
     - numpy scalars → Python floats
     """
+    import numpy as np
+
     result = []
     for v in series:
         if v is None:
@@ -31,137 +36,195 @@ def to_json_safe(series: pd.Series) -> list:
     return result
 
 
-@router.get("/signals", response_model=SignalsResponse)
-def get_signals(tickers: list[str] = Query(...),  years: int = 1,  simulations: int = 500):
+def last_bar_date(panel_df: "pd.DataFrame") -> str:
     """
-    Generate BUY / SELL / NO_TRADE signals for given tickers.
+    Date of the most recent bar in a panel, used in ETags.
     """
+    return str(panel_df["Date"].iloc[-1])
 
-    end = datetime.now()
-    start = datetime(end.year - 1, end.month, end.day)
 
-    # 1. Load market data
-    svc = MarketDataService(start, end)
-    panel_df = svc.load_panel(tickers)
-
-    # 2. Compute returnss
-    panel_df = DailyReturnsAnalyzer.compute(panel_df, tickers)
-
-    signals = []
+def plan_headers(plan: SimulationPlan) -> dict[str, str]:
+    """
+    Tell clients how the simulation actually ran (it may have been downgraded).
+    """
+    headers = {
+        "X-Simulations": str(plan.simulations),
+        "X-Simulation-Mode": plan.mode,
+    }
+    if plan.downgraded:
+        headers["X-Simulation-Downgraded"] = "true"
+    return headers
 
-    for ticker in tickers:
-        # 3. Monte Carlo simulation
-        sim_df = MonteCarloSimulator.simulate(
-            panel_df,
-            ticker=ticker,
-            years=years,
-            simulations=simulations
-        )
 
-        current_price = panel_df[f"Close_{ticker}"].iloc[-1]
+@router.get("/signals", response_model=SignalsResponse)
+def get_signals(
+    request: Request,
+    tickers: list[str] = Query(...),
+    years: int = Query(1, ge=1),
+    simulations: int = Query(500, ge=1),
+):
+    """
+    Generate BUY / SELL / NO_TRADE signals for given tickers.
+    """
+    from app.services.signal.generator import SignalGenerator
 
-        # 4. Confidence metrics
-        metrics = SignalConfidenceCalculator.from_monte_carlo(
-            current_price,
-            sim_df
-        )
+    plan = scheduler.plan_signals(len(tickers), years, simulations)
 
-        # Using current baseline confidence logic
-        confidence = abs(metrics["expected_return"]) * (1 - metrics["prob_loss"])
-
-        decision = SignalRanker.classify({
-            **metrics,
-            "confidence": confidence
-        })
-
-        signals.append(
-            SignalMetrics(
-                ticker=ticker,
-                current_price=float(current_price),
-                expected_return=metrics["expected_return"],
-                expected_price=current_price * (1 + metrics["expected_return"]),
-                prob_gain=metrics["prob_gain"],
-                prob_loss=metrics["prob_loss"],
-                downside_95=metrics["downside_pct_95"],
-                signal=decision["signal"],
-                confidence=round(confidence, 4)
-            )
-        )
+    panel_df = SignalGenerator.market_data().load_panel(tickers)
+    etag = compute_etag(
+        "signals",
+        tickers,
+        last_bar_date(panel_df),
+        {"years": years, "simulations": plan.simulations, "mode": plan.mode}
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
 
-    ranked = SignalRanker.rank([s.dict() for s in signals])
+    ranked = SignalGenerator.generate(tickers, years, plan)
 
-    return SignalsResponse(
-        signals=[SignalMetrics(**s) for s in ranked]
+    return cached_json(
+        request,
+        SignalsResponse(signals=[SignalMetrics(**s) for s in ranked]),
+        etag,
+        plan_headers(plan)
     )
 
 
 @router.get("/prices/{ticker}")
-def get_prices(ticker: str, years: int = 1):
+def get_prices(
+    request: Request,
+    ticker: str,
+    years: int = Query(1, ge=1),
+    max_points: int | None = Query(None, ge=3),
+    method: Literal["lttb", "minmax"] = "lttb",
+    response_format: Literal["default", "columnar"] = Query("default", alias="format"),
+):
+    """
+    Close prices with 20D / 50D SMAs.
+
+    max_points downsamples every series with the same shape-preserving row
+    selection (SMAs are computed on the full history first).
+    format=columnar returns {"columns": [...], "data": [[...], ...]} with ISO
+    dates and values rounded to 4 decimals.
+    """
+    from app.services.market_data import get_market_data_service
+    from app.services.analytics.price import PriceAnalytics
+    from app.services.analytics.downsample import Downsampler
+
     end = datetime.now()
     start = datetime(end.year - years, end.month, end.day)
 
-    svc = MarketDataService(start, end)
+    svc = get_market_data_service(start, end)
     panel_df = svc.load_panel([ticker])
 
-    panel_df = PriceAnalytics.moving_averages(
+    etag = compute_etag(
+        "prices",
+        [ticker],
+        last_bar_date(panel_df),
+        {"years": years, "max_points": max_points, "method": method, "format": response_format}
+    )
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
+    trend_df = PriceAnalytics.moving_average_frame(
         panel_df,
         ticker=ticker,
         windows=[20, 50]
     )
-    
+    total_points = len(trend_df)
+
     # JSON supports null → Python uses None
     close_col = f"Close_{ticker}"
     sma20_col = f"SMA_20_{ticker}"
     sma50_col = f"SMA_50_{ticker}"
 
-    return {
-        "dates": panel_df.index.astype(str).tolist(),
-        "prices": to_json_safe(panel_df[close_col]),
-        "sma20": to_json_safe(panel_df[sma20_col]),
-        "sma50": to_json_safe(panel_df[sma50_col]),
-    }
+    if max_points is not None and max_points < total_points:
+        # Select rows on the (gap-filled) close, apply them to every series
+        close = trend_df[close_col].ffill().bfill().to_numpy()
+        trend_df = trend_df.iloc[Downsampler.indices(close, max_points, method)]
+
+    if response_format == "columnar":
+        return cached_json(request, {
+            "ticker": ticker,
+            "total_points": total_points,
+            "columns": ["date", "price", "sma20", "sma50"],
+            "data": [
+                trend_df["Date"].dt.strftime("%Y-%m-%d").tolist(),
+                to_json_safe(trend_df[close_col].round(4)),
+                to_json_safe(trend_df[sma20_col].round(4)),
+                to_json_safe(trend_df[sma50_col].round(4)),
+            ],
+        }, etag)
+
+    return cached_json(request, {
+        "dates": trend_df.index.astype(str).tolist(),
+        "prices": to_json_safe(trend_df[close_col]),
+        "sma20": to_json_safe(trend_df[sma20_col]),
+        "sma50": to_json_safe(trend_df[sma50_col]),
+    }, etag)
 
         
 @router.get("/returns/{ticker}")
-def get_daily_returns(ticker: str, years: int = 1):
+def get_daily_returns(request: Request, ticker: str, years: int = Query(1, ge=1)):
+    from app.services.market_data import get_market_data_service
+
     end = datetime.now()
     start = datetime(end.year - years, end.month, end.day)
 
-    svc = MarketDataService(start, end)
+    svc = get_market_data_service(start, end)
     panel_df = svc.load_panel([ticker])
 
+    etag = compute_etag("returns", [ticker], last_bar_date(panel_df), {"years": years})
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+
     prices = panel_df[f"Close_{ticker}"]
     returns = prices.pct_change().dropna()
 
-    return {
+    return cached_json(request, {
         "returns": returns.tolist()
-    }
+    }, etag)
     
 @router.get("/monte-carlo/{ticker}")
-def get_monte_carlo_paths(ticker: str, years: int = 1, simulations: int = 300):
+def get_monte_carlo_paths(
+    response: Response,
+    ticker: str,
+    years: int = Query(1, ge=1),
+    simulations: int = Query(300, ge=1),
+):
+    import numpy as np
+    import pandas as pd
+    from app.services.market_data import get_market_data_service
+    from app.services.analytics.returns import DailyReturnsAnalyzer
+    from app.services.analytics.monte_carlo import MonteCarloSimulator
+
     end = datetime.now()
     start = datetime(end.year - 1, end.month, end.day)
 
-    svc = MarketDataService(start, end)
+    plan = scheduler.plan_paths(years, simulations)
+    response.headers.update(plan_headers(plan))
+
+    svc = get_market_data_service(start, end)
     panel_df = svc.load_panel([ticker])
     panel_df = DailyReturnsAnalyzer.compute(panel_df, [ticker])
 
-    sim_df = MonteCarloSimulator.simulate(
-        panel_df,
-        ticker=ticker,
-        years=years,
-        simulations=simulations
-    )
+    with scheduler.admit(plan):
+        sim_df = MonteCarloSimulator.simulate(
+            panel_df,
+            ticker=ticker,
+            years=years,
+            simulations=plan.simulations
+        )
 
-    safe_paths = (
-        sim_df
-        .replace([np.inf, -np.inf], None)
-        .where(pd.notna(sim_df), None)
-        .values
-        .tolist()
-    )
+        safe_paths = (
+            sim_df
+            .replace([np.inf, -np.inf], None)
+            .where(pd.notna(sim_df), None)
+            .values
+            .tolist()
+        )
 
-    safe_final = to_json_safe(sim_df.iloc[-1])
+        safe_final = to_json_safe(sim_df.iloc[-1])
 
     return {
         "paths": safe_paths,
@@ -0,0 +1,113 @@
+# app/config.py
+
+import os
+from dataclasses import dataclass, field
+
+
+def _env_list(name: str, default: str = "") -> list[str]:
+    raw = os.getenv(name, default)
+    return [item.strip().upper() for item in raw.split(",") if item.strip()]
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Runtime configuration, read once from environment variables.
+    """
+
+    # Snapshot of cached panels / signals restored at boot, saved at shutdown
+    snapshot_path: str = field(
+        default_factory=lambda: os.getenv("MT_SNAPSHOT_PATH", ".cache/snapshot.pkl")
+    )
+
+    # Per-process bound on each of the panel and signal caches (LRU)
+    cache_max_entries: int = field(
+        default_factory=lambda: int(os.getenv("MT_CACHE_MAX_ENTRIES", "256"))
+    )
+
+    # Tickers loaded and scored during startup, before /ready turns green
+    warmup_tickers: list[str] = field(
+        default_factory=lambda: _env_list("MT_WARMUP_TICKERS")
+    )
+    warmup_years: int = field(
+        default_factory=lambda: int(os.getenv("MT_WARMUP_YEARS", "1"))
+    )
+    warmup_simulations: int = field(
+        default_factory=lambda: int(os.getenv("MT_WARMUP_SIMULATIONS", "500"))
+    )
+    # How long shutdown waits for an unfinished warm-up before giving up on it
+    warmup_shutdown_timeout: float = field(
+        default_factory=lambda: float(os.getenv("MT_WARMUP_SHUTDOWN_TIMEOUT_S", "10"))
+    )
+
+    # tmpfs directory for panels / results shared by all uvicorn workers
+    # on this host (e.g. /dev/shm/market-telemetry); empty disables sharing
+    shared_dir: str = field(
+        default_factory=lambda: os.getenv("MT_SHARED_DIR", "")
+    )
+    # Host-wide bounds on that directory (it lives in RAM); the oldest
+    # segments are evicted on publish once either is exceeded
+    shared_max_segments: int = field(
+        default_factory=lambda: int(os.getenv("MT_SHARED_MAX_SEGMENTS", "1024"))
+    )
+    shared_max_mb: int = field(
+        default_factory=lambda: int(os.getenv("MT_SHARED_MAX_MB", "512"))
+    )
+
+    # "yahoo" (live yfinance) or "synthetic" (deterministic offline panels)
+    market_data_provider: str = field(
+        default_factory=lambda: os.getenv("MT_MARKET_DATA_PROVIDER", "yahoo").lower()
+    )
+    # Artificial latency of each synthetic download, in milliseconds
+    synthetic_latency_ms: float = field(
+        default_factory=lambda: float(os.getenv("MT_SYNTHETIC_LATENCY_MS", "0"))
+    )
+
+    # Number of uvicorn worker processes on this host; the simulation budget
+    # and concurrency below are host-wide totals split evenly between them
+    workers: int = field(
+        default_factory=lambda: int(os.getenv("MT_WORKERS", os.getenv("WEB_CONCURRENCY", "1")))
+    )
+
+    # Admission control for Monte Carlo work (see app/services/scheduler.py).
+    # sim_max_concurrent + sim_max_queue is clamped to stay below the server
+    # thread pool so /prices and /returns always find a free thread.
+    sim_memory_budget_mb: int = field(
+        default_factory=lambda: int(os.getenv("MT_SIM_MEMORY_BUDGET_MB", "1024"))
+    )
+    sim_job_memory_mb: int = field(
+        default_factory=lambda: int(os.getenv("MT_SIM_JOB_MEMORY_MB", "256"))
+    )
+    sim_max_cells: int = field(
+        default_factory=lambda: int(os.getenv("MT_SIM_MAX_CELLS", "500000000"))
+    )
+    sim_max_simulations: int = field(
+        default_factory=lambda: int(os.getenv("MT_SIM_MAX_SIMULATIONS", "20000"))
+    )
+    sim_min_simulations: int = field(
+        default_factory=lambda: int(os.getenv("MT_SIM_MIN_SIMULATIONS", "100"))
+    )
+    sim_max_concurrent: int = field(
+        default_factory=lambda: int(os.getenv("MT_SIM_MAX_CONCURRENT", str(min(os.cpu_count() or 2, 8))))
+    )
+    sim_max_queue: int = field(
+        default_factory=lambda: int(os.getenv("MT_SIM_MAX_QUEUE", "16"))
+    )
+    sim_queue_timeout: float = field(
+        default_factory=lambda: float(os.getenv("MT_SIM_QUEUE_TIMEOUT_S", "10"))
+    )
+
+    # HTTP caching: responses stay fresh until the next daily bar is expected
+    market_timezone: str = field(
+        default_factory=lambda: os.getenv("MT_MARKET_TIMEZONE", "America/New_York")
+    )
+    daily_bar_time: str = field(
+        default_factory=lambda: os.getenv("MT_DAILY_BAR_TIME", "16:30")
+    )
+    # Responses at least this large are gzip / brotli compressed
+    compress_min_bytes: int = field(
+        default_factory=lambda: int(os.getenv("MT_COMPRESS_MIN_BYTES", "1024"))
+    )
+
+
+settings = Settings()
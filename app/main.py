@@ -1,11 +1,78 @@
 # app/main.py
 
-from fastapi import FastAPI
+import time
+
+_BOOT_TIME = time.perf_counter()
+
+import asyncio
+import logging
+import threading
+from contextlib import asynccontextmanager
+from dataclasses import asdict
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
 from app.api.routes import router
+from app.config import settings
+from app.services import cache, warmup
+from app.services.scheduler import AdmissionRejected
+
+logger = logging.getLogger(__name__)
+
+warmup.state.import_seconds = round(time.perf_counter() - _BOOT_TIME, 4)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so the server can answer /ready meanwhile.
+    # A daemon thread: a hung download must not keep the process alive.
+    thread = threading.Thread(
+        target=warmup.run, args=(settings, _BOOT_TIME), name="warmup", daemon=True
+    )
+    thread.start()
+    yield
+    await asyncio.to_thread(thread.join, settings.warmup_shutdown_timeout)
+
+    if thread.is_alive():
+        # It would also write the snapshot when done: don't race it
+        logger.warning(
+            "Warm-up still running after %.0fs, shutting down without saving the snapshot",
+            settings.warmup_shutdown_timeout,
+        )
+        return
+
+    try:
+        cache.save_snapshot(settings.snapshot_path)
+    except OSError:
+        logger.warning("Could not save snapshot to %s", settings.snapshot_path, exc_info=True)
+
 
 app = FastAPI(
     title="Market Telemetry & Signal Ranking API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
-app.include_router(router)
\ No newline at end of file
+app.include_router(router)
+
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected(request: Request, exc: AdmissionRejected):
+    headers = {}
+    if exc.retry_after is not None:
+        headers["Retry-After"] = str(exc.retry_after)
+    return JSONResponse(
+        {"detail": exc.detail},
+        status_code=exc.status_code,
+        headers=headers
+    )
+
+
+@app.get("/ready")
+def ready():
+    """
+    Readiness probe: 503 until the startup warm-up has finished.
+    """
+    status_code = 200 if warmup.state.ready else 503
+    return JSONResponse(asdict(warmup.state), status_code=status_code)
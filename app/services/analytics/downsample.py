@@ -0,0 +1,112 @@
+# app/services/analytics/downsample.py
+
+import numpy as np
+
+
+class Downsampler:
+    """
+    Shape-preserving downsampling of chart series.
+
+    Both methods return sorted row positions, so the same selection can be
+    applied to every series of a chart (price, SMAs, dates) and they stay
+    aligned. The first and last points are always kept.
+    """
+
+    METHODS = ("lttb", "minmax")
+
+    @staticmethod
+    def indices(values: np.ndarray, max_points: int, method: str = "lttb") -> np.ndarray:
+        """
+        Positions of at most max_points rows chosen from values.
+
+        values must be finite (fill gaps before calling).
+        """
+        if method == "lttb":
+            return Downsampler.lttb_indices(values, max_points)
+        if method == "minmax":
+            return Downsampler.minmax_indices(values, max_points)
+        raise ValueError(f"Unknown downsampling method: {method}")
+
+    @staticmethod
+    def lttb_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+        """
+        Largest-Triangle-Three-Buckets.
+
+        Picks, per bucket, the point forming the largest triangle with the
+        previously selected point and the mean of the next bucket. Buckets are
+        walked in order (each choice depends on the previous one), the
+        triangle areas within a bucket are computed in one numpy pass.
+        """
+        n = len(values)
+        if max_points >= n:
+            return np.arange(n)
+        if max_points < 3:
+            raise ValueError("max_points must be at least 3")
+
+        y = np.asarray(values, dtype=np.float64)
+        x = np.arange(n, dtype=np.float64)
+
+        # max_points - 2 buckets over the interior points, then the last point
+        edges = np.linspace(1, n - 1, max_points - 1).astype(np.int64)
+        edges = np.append(edges, n)
+
+        # Mean of every "next" bucket, computed once
+        sums = np.add.reduceat(y, edges[:-1])
+        counts = np.diff(edges)
+        next_x = (edges[:-1] + edges[1:] - 1) / 2
+        next_y = sums / counts
+
+        selected = np.empty(max_points, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = n - 1
+
+        a = 0
+        for i in range(max_points - 2):
+            lo, hi = edges[i], edges[i + 1]
+            area = np.abs(
+                (x[a] - next_x[i + 1]) * (y[lo:hi] - y[a])
+                - (x[a] - x[lo:hi]) * (next_y[i + 1] - y[a])
+            )
+            a = lo + int(np.argmax(area))
+            selected[i + 1] = a
+
+        return selected
+
+    @staticmethod
+    def minmax_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+        """
+        Min/max bucketing, fully vectorised.
+
+        Splits the interior into equal buckets and keeps each bucket's
+        minimum and maximum, so every peak and trough survives. Below 4
+        points there is no room for a min/max pair, so LTTB is used instead.
+        """
+        n = len(values)
+        if max_points >= n:
+            return np.arange(n)
+        if max_points < 4:
+            return Downsampler.lttb_indices(values, max_points)
+
+        y = np.asarray(values, dtype=np.float64)
+        interior = y[1:-1]
+        m = len(interior)
+
+        n_buckets = (max_points - 2) // 2
+        size = -(-m // n_buckets)
+        rows = -(-m // size)
+
+        # Pad the tail so the interior reshapes into (rows, size); padding
+        # can never win a min or a max
+        pad = rows * size - m
+        lows = np.concatenate([interior, np.full(pad, np.inf)]).reshape(rows, size)
+        highs = np.concatenate([interior, np.full(pad, -np.inf)]).reshape(rows, size)
+
+        offsets = np.arange(rows) * size + 1
+        picks = np.concatenate([
+            [0],
+            offsets + lows.argmin(axis=1),
+            offsets + highs.argmax(axis=1),
+            [n - 1],
+        ])
+
+        return np.unique(picks)
@@ -10,18 +10,9 @@ class MonteCarloSimulator:
     """
 
     @staticmethod
-    def simulate(
-                    panel_df: pd.DataFrame,
-                    ticker: str,
-                    years: int,
-                    simulations: int,
-                    seed: int = 42
-                ) -> pd.DataFrame:
+    def _gbm_params(panel_df: pd.DataFrame, ticker: str) -> tuple[float, float, float]:
         """
-        Simulate future price paths using geometric Brownian motion.
-
-        Returns:
-            DataFrame with shape (trading_days, simulations)
+        Last price and annualised drift / volatility of log returns.
         """
         close_col = f"Close_{ticker}"
         if close_col not in panel_df.columns:
@@ -36,12 +27,32 @@ class MonteCarloSimulator:
         mu = log_returns.mean() * 252
         sigma = log_returns.std() * np.sqrt(252)
 
+        return prices.iloc[-1], mu, sigma
+
+    @staticmethod
+    def simulate(
+                    panel_df: pd.DataFrame,
+                    ticker: str,
+                    years: int,
+                    simulations: int,
+                    seed: int = 42
+                ) -> pd.DataFrame:
+        """
+        Simulate future price paths using geometric Brownian motion.
+
+        Returns:
+            DataFrame with shape (trading_days, simulations)
+        """
+        last_price, mu, sigma = MonteCarloSimulator._gbm_params(panel_df, ticker)
+
         trading_days = 252 * years
         dt = 1 / trading_days
 
-        np.random.seed(seed)
+        # Private generator: concurrent simulations must not share numpy's
+        # global state (same stream as np.random.seed + np.random.normal)
+        rng = np.random.RandomState(seed)
 
-        rand = np.random.normal(
+        rand = rng.normal(
             loc=0,
             scale=1,
             size=(trading_days, simulations)
@@ -50,12 +61,48 @@ class MonteCarloSimulator:
         drift = (mu - 0.5 * sigma**2) * dt
         diffusion = sigma * np.sqrt(dt) * rand
 
-        price_paths = prices.iloc[-1] * np.exp(
+        price_paths = last_price * np.exp(
             np.cumsum(drift + diffusion, axis=0)
         )
 
         return pd.DataFrame(price_paths)
 
+    @staticmethod
+    def simulate_terminal(
+                    panel_df: pd.DataFrame,
+                    ticker: str,
+                    years: int,
+                    simulations: int,
+                    seed: int = 42,
+                    chunk_days: int = 21
+                ) -> pd.DataFrame:
+        """
+        Final prices only, drawing the random matrix chunk_days rows at a time.
+
+        Uses the same random stream as simulate(), so the final prices match
+        its last row (up to float summation order), while memory stays at
+        chunk_days × simulations instead of trading_days × simulations.
+
+        Returns:
+            DataFrame with shape (1, simulations)
+        """
+        last_price, mu, sigma = MonteCarloSimulator._gbm_params(panel_df, ticker)
+
+        trading_days = 252 * years
+        dt = 1 / trading_days
+
+        rng = np.random.RandomState(seed)
+
+        drift = (mu - 0.5 * sigma**2) * dt
+        log_total = np.zeros(simulations)
+
+        for start in range(0, trading_days, chunk_days):
+            rows = min(chunk_days, trading_days - start)
+            rand = rng.normal(loc=0, scale=1, size=(rows, simulations))
+            log_total += (drift + sigma * np.sqrt(dt) * rand).sum(axis=0)
+
+        return pd.DataFrame([last_price * np.exp(log_total)])
+
     @staticmethod
     def summary(simulations_df: pd.DataFrame) -> dict[str, float]:
         """
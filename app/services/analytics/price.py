@@ -18,4 +18,26 @@ class PriceAnalytics:
         for w in windows:
             df[f"SMA_{w}_{ticker}"] = df[close_col].rolling(w).mean()
 
-        return df
\ No newline at end of file
+        return df
+
+    @staticmethod
+    def moving_average_frame(panel_df: pd.DataFrame, ticker: str, windows: list[int]) -> pd.DataFrame:
+        """
+        Date, close and SMA columns for one ticker, without copying the panel.
+
+        Output columns:
+        - Date
+        - Close_<TICKER>
+        - SMA_<WINDOW>_<TICKER>
+        """
+        close_col = f"Close_{ticker}"
+        if close_col not in panel_df.columns:
+            raise KeyError(f"Missing column {close_col}")
+
+        close = panel_df[close_col]
+
+        return pd.DataFrame({
+            "Date": panel_df["Date"],
+            close_col: close,
+            **{f"SMA_{w}_{ticker}": close.rolling(w).mean() for w in windows},
+        })
@@ -0,0 +1,172 @@
+# app/services/cache.py
+
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Hashable
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+
+
+class ResultCache:
+    """
+    Thread-safe in-process cache for panels and computed results.
+
+    Keys are tuples whose first element is the as-of date. When a key for a
+    newer date arrives, entries from earlier days are dropped, together with
+    the shared store's segments for those days. At most max_entries are
+    kept, least recently used first out.
+    Cached values are shared between requests and must not be mutated.
+
+    When a shared store is attached (see enable_shared_store), misses go
+    through it so every worker process on the host reuses one copy.
+    """
+
+    def __init__(self, name: str, max_entries: int):
+        self.name = name
+        self.max_entries = max_entries
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self._as_of: date | None = None
+        self.shared = None
+        self.codec = None
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        rolled_over = False
+
+        with self._lock:
+            if self._as_of is None or key[0] > self._as_of:
+                rolled_over = self._as_of is not None
+                self._as_of = key[0]
+                self._drop_stale(key[0])
+
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+        if rolled_over and self.shared is not None:
+            self.shared.prune(key[0])
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, calling loader on a miss.
+        """
+        value = self.get(key)
+        if value is None:
+            if self.shared is not None:
+                value = self.shared.get_or_publish(key, loader, self.codec)
+            else:
+                value = loader()
+            self.set(key, value)
+        return value
+
+    def items(self) -> dict[Hashable, Any]:
+        with self._lock:
+            return dict(self._data)
+
+    def prune(self, as_of: date) -> int:
+        """
+        Drop entries that were computed for another as-of date.
+        """
+        with self._lock:
+            return self._drop_stale(as_of)
+
+    def _drop_stale(self, as_of: date) -> int:
+        stale = [k for k in self._data if k[0] != as_of]
+        for k in stale:
+            del self._data[k]
+        return len(stale)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+panel_cache = ResultCache("panels", settings.cache_max_entries)
+signal_cache = ResultCache("signals", settings.cache_max_entries)
+
+CACHES = (panel_cache, signal_cache)
+
+
+def enable_shared_store(directory: str) -> None:
+    """
+    Back the panel and signal caches with a cross-process SharedStore.
+    """
+    from app.services.shared_store import FrameCodec, JsonCodec, SharedStore
+
+    store = SharedStore(
+        directory,
+        max_segments=settings.shared_max_segments,
+        max_bytes=settings.shared_max_mb * 1024 * 1024,
+    )
+    store.prune(date.today())
+
+    panel_cache.shared, panel_cache.codec = store, FrameCodec
+    signal_cache.shared, signal_cache.codec = store, JsonCodec
+
+
+def save_snapshot(path: str) -> None:
+    """
+    Persist every cache to a pickle file (written atomically).
+    """
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "caches": {c.name: c.items() for c in CACHES},
+    }
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    # Every worker saves on shutdown: keep temporary files per process
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as fh:
+        pickle.dump(payload, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def restore_snapshot(path: str, as_of: date) -> int:
+    """
+    Load a snapshot written by save_snapshot, keeping only entries for as_of.
+
+    Returns:
+        number of entries restored
+    """
+    if not os.path.exists(path):
+        return 0
+
+    try:
+        with open(path, "rb") as fh:
+            payload = pickle.load(fh)
+    except Exception:
+        logger.warning("Ignoring unreadable snapshot %s", path, exc_info=True)
+        return 0
+
+    if payload.get("version") != SNAPSHOT_VERSION:
+        return 0
+
+    restored = 0
+    for cache in CACHES:
+        for key, value in payload["caches"].get(cache.name, {}).items():
+            if key[0] != as_of:
+                continue
+            # Goes through the shared store when enabled, so workers restoring
+            # the same snapshot end up attached to a single copy
+            cache.get_or_load(key, lambda value=value: value)
+            restored += 1
+
+    return restored
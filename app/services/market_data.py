@@ -2,7 +2,9 @@
 
 from datetime import datetime
 import pandas as pd
-import yfinance as yf
+
+from app.config import settings
+from app.services.cache import panel_cache
 
 
 class MarketDataService:
@@ -10,6 +12,9 @@ class MarketDataService:
     Handles all market data ingestion from Yahoo Finance.
     """
 
+    # Part of every cache key, so panels from different providers never mix
+    provider = "yahoo"
+
     def __init__(self, start: datetime, end: datetime):
         self.start = start
         self.end = end
@@ -18,7 +23,7 @@ class MarketDataService:
         """
         Load data for a single ticker.
         """
-        df = yf.download(ticker, self.start, self.end, progress=False)
+        df = self._download(ticker)
         if df.empty:
             raise ValueError(f"No data returned for ticker {ticker}")
         return df
@@ -36,8 +41,23 @@ class MarketDataService:
         """
         Load multiple tickers into a single flattened DataFrame.
         Matches your existing 'data' variable.
+
+        Panels are cached per (end date, start date, tickers); the returned
+        DataFrame is shared and must not be modified in place.
+        """
+        key = (self.end.date(), self.provider, self.start.date(), tuple(tickers))
+        return panel_cache.get_or_load(key, lambda: self._download_panel(tickers))
+
+    def _download(self, tickers: str | list[str]) -> pd.DataFrame:
+        """
+        Raw yfinance-shaped OHLC frame. Override to plug in another provider.
         """
-        df = yf.download(tickers, self.start, self.end, progress=False)
+        import yfinance as yf  # deferred: importing yfinance is slow
+
+        return yf.download(tickers, self.start, self.end, progress=False)
+
+    def _download_panel(self, tickers: list[str]) -> pd.DataFrame:
+        df = self._download(tickers)
 
         # Reset index (Date → column)
         df = df.reset_index()
@@ -52,3 +72,19 @@ class MarketDataService:
         df = df.rename(columns={"Date_": "Date"})
 
         return df
+
+
+def get_market_data_service(start: datetime, end: datetime) -> MarketDataService:
+    """
+    Market data provider selected by MT_MARKET_DATA_PROVIDER.
+    """
+    provider = settings.market_data_provider
+
+    if provider == "yahoo":
+        return MarketDataService(start, end)
+
+    if provider == "synthetic":
+        from app.services.synthetic_data import SyntheticMarketDataService
+        return SyntheticMarketDataService(start, end, latency_ms=settings.synthetic_latency_ms)
+
+    raise ValueError(f"Unknown market data provider: {provider}")
@@ -0,0 +1,264 @@
+# app/services/scheduler.py
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+from app.config import Settings, settings
+
+# Bytes per (day × path) cell while simulating full paths: the random matrix,
+# drift + diffusion, cumsum and exp results are all float64 temporaries.
+PATH_BYTES_PER_CELL = 8 * 4
+
+# Extra bytes per cell when /monte-carlo serialises every path to JSON
+# (Python float objects, list slots and the encoded text).
+SERIALIZED_BYTES_PER_CELL = 64
+
+# Rows of the random matrix drawn at once in terminal-only mode
+TERMINAL_CHUNK_DAYS = 21
+
+# Sync endpoints run on the server thread pool (40 threads by default).
+# Running plus queued simulations may hold at most SIMULATION_THREADS of them,
+# the rest stay free for /prices, /returns and other cheap requests.
+THREAD_POOL_SIZE = 40
+SIMULATION_THREADS = THREAD_POOL_SIZE - 16
+
+
+def _require_positive(**values: int) -> None:
+    for name, value in values.items():
+        if value < 1:
+            raise ValueError(f"{name} must be a positive integer, got {value}")
+
+
+class AdmissionRejected(Exception):
+    """
+    Simulation work that cannot be scheduled now (or at all).
+
+    status_code is 429 (queue full / request too large) or 503
+    (budget exhausted for longer than the queue timeout).
+    """
+
+    def __init__(self, status_code: int, detail: str, retry_after: int | None = None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class SimulationPlan:
+    """
+    How a simulation request will actually run, after any downgrade.
+    """
+    simulations: int
+    terminal_only: bool
+    cells: int
+    memory_bytes: int
+    downgraded: bool
+
+    @property
+    def mode(self) -> str:
+        return "terminal" if self.terminal_only else "paths"
+
+
+class SimulationScheduler:
+    """
+    Cost-aware admission control in front of Monte Carlo work.
+
+    Cost is tickers × trading days × simulations (CPU) plus the peak memory of
+    one ticker's simulation. Oversized requests are downgraded first (terminal-
+    only mode, then fewer paths); admitted jobs share a memory budget and a
+    fixed number of concurrent slots, and waiting jobs are served cheapest
+    first so interactive requests are not stuck behind large batches.
+
+    Each worker process owns one scheduler holding an equal share of the
+    host-wide budget (see from_settings).
+    """
+
+    def __init__(
+        self,
+        memory_budget_bytes: int,
+        job_memory_bytes: int,
+        max_cells: int,
+        max_simulations: int,
+        min_simulations: int,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+    ):
+        self.memory_budget_bytes = memory_budget_bytes
+        self.job_memory_bytes = min(job_memory_bytes, memory_budget_bytes)
+        self.max_cells = max_cells
+        self.max_simulations = max_simulations
+        self.min_simulations = min_simulations
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+
+        self._cond = threading.Condition()
+        self._waiting: list[tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._memory_in_use = 0
+        self._running = 0
+        self._avg_seconds = 1.0
+
+    @classmethod
+    def from_settings(cls, s: Settings) -> "SimulationScheduler":
+        """
+        Scheduler for one worker process.
+
+        The memory budget and concurrency settings are host-wide; each of the
+        s.workers processes gets an equal share. Concurrency plus queue length
+        is capped at SIMULATION_THREADS.
+        """
+        mb = 1024 * 1024
+        workers = max(1, s.workers)
+
+        # Blocked simulation threads must not starve the thread pool
+        max_concurrent = max(1, min(s.sim_max_concurrent // workers, SIMULATION_THREADS))
+        max_queue = max(0, min(s.sim_max_queue, SIMULATION_THREADS - max_concurrent))
+
+        return cls(
+            memory_budget_bytes=s.sim_memory_budget_mb * mb // workers,
+            job_memory_bytes=s.sim_job_memory_mb * mb,
+            max_cells=s.sim_max_cells,
+            max_simulations=s.sim_max_simulations,
+            min_simulations=s.sim_min_simulations,
+            max_concurrent=max_concurrent,
+            max_queue=max_queue,
+            queue_timeout=s.sim_queue_timeout,
+        )
+
+    def plan_signals(self, n_tickers: int, years: int, simulations: int) -> SimulationPlan:
+        """
+        Plan for /signals, which only needs final prices.
+
+        Full paths are kept while they fit the per-job memory limit, otherwise
+        the job switches to terminal-only mode; simulations are then reduced
+        until the CPU cost fits max_cells.
+        """
+        _require_positive(n_tickers=n_tickers, years=years, simulations=simulations)
+
+        days = 252 * years
+        sims = self._fit_simulations(simulations, n_tickers * days, self.max_cells)
+
+        terminal_only = days * sims * PATH_BYTES_PER_CELL > self.job_memory_bytes
+        rows = min(days, TERMINAL_CHUNK_DAYS) if terminal_only else days
+        memory = rows * sims * PATH_BYTES_PER_CELL
+
+        if memory > self.job_memory_bytes:
+            sims = self._fit_simulations(
+                sims, rows * PATH_BYTES_PER_CELL, self.job_memory_bytes
+            )
+            memory = rows * sims * PATH_BYTES_PER_CELL
+
+        return SimulationPlan(
+            simulations=sims,
+            terminal_only=terminal_only,
+            cells=n_tickers * days * sims,
+            memory_bytes=memory,
+            downgraded=terminal_only or sims != simulations,
+        )
+
+    def plan_paths(self, years: int, simulations: int) -> SimulationPlan:
+        """
+        Plan for /monte-carlo, which returns every path: only fewer paths help.
+        """
+        _require_positive(years=years, simulations=simulations)
+
+        days = 252 * years
+        per_path = days * (PATH_BYTES_PER_CELL + SERIALIZED_BYTES_PER_CELL)
+
+        sims = self._fit_simulations(simulations, days, self.max_cells)
+        sims = self._fit_simulations(sims, per_path, self.job_memory_bytes)
+
+        return SimulationPlan(
+            simulations=sims,
+            terminal_only=False,
+            cells=days * sims,
+            memory_bytes=per_path * sims,
+            downgraded=sims != simulations,
+        )
+
+    def _fit_simulations(self, simulations: int, cost_per_sim: int, limit: int) -> int:
+        """
+        Largest simulation count ≤ simulations whose cost stays within limit.
+        """
+        sims = min(simulations, self.max_simulations, limit // max(cost_per_sim, 1))
+        if sims < self.min_simulations:
+            if simulations <= self.min_simulations and simulations * cost_per_sim <= limit:
+                return simulations
+            raise AdmissionRejected(
+                429,
+                "Request exceeds the per-request simulation budget even at "
+                f"{self.min_simulations} simulations; reduce tickers or years."
+            )
+        return sims
+
+    @contextmanager
+    def admit(self, plan: SimulationPlan):
+        """
+        Block until plan fits this worker's budget, then hold its share while running.
+
+        Raises AdmissionRejected when the queue is full (429) or the job waited
+        longer than queue_timeout (503).
+        """
+        ticket = (plan.cells, next(self._seq))
+        deadline = time.monotonic() + self.queue_timeout
+
+        with self._cond:
+            # The queue limit only applies to jobs that cannot start right away
+            must_wait = bool(self._waiting) or not self._fits(plan)
+            if must_wait and len(self._waiting) >= self.max_queue:
+                raise AdmissionRejected(
+                    429, "Simulation queue is full, retry later.", self._retry_after()
+                )
+
+            heapq.heappush(self._waiting, ticket)
+            while not (self._waiting[0] == ticket and self._fits(plan)):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._waiting.remove(ticket)
+                    heapq.heapify(self._waiting)
+                    self._cond.notify_all()
+                    raise AdmissionRejected(
+                        503, "Simulation capacity exhausted, retry later.", self._retry_after()
+                    )
+                self._cond.wait(remaining)
+
+            heapq.heappop(self._waiting)
+            self._memory_in_use += plan.memory_bytes
+            self._running += 1
+            # The next-cheapest waiter may fit as well
+            self._cond.notify_all()
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - started
+            with self._cond:
+                self._memory_in_use -= plan.memory_bytes
+                self._running -= 1
+                self._avg_seconds = 0.8 * self._avg_seconds + 0.2 * elapsed
+                self._cond.notify_all()
+
+    def _fits(self, plan: SimulationPlan) -> bool:
+        return (
+            self._running < self.max_concurrent
+            and self._memory_in_use + plan.memory_bytes <= self.memory_budget_bytes
+        )
+
+    def _retry_after(self) -> int:
+        """
+        Seconds until the current backlog is expected to drain.
+        """
+        backlog = len(self._waiting) + self._running
+        return max(1, math.ceil(self._avg_seconds * backlog / self.max_concurrent))
+
+
+scheduler = SimulationScheduler.from_settings(settings)
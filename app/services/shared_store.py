@@ -0,0 +1,260 @@
+# app/services/shared_store.py
+
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from datetime import date
+from typing import Any, Callable, Hashable
+
+import numpy as np
+import pandas as pd
+
+# Segment layout:
+#   [8 bytes: header length][header JSON][padding][block 0][block 1]...
+# The data region and every block start on an ALIGN boundary; block offsets
+# in the header are relative to the start of the data region.
+ALIGN = 64
+_HEADER_LEN = struct.Struct("<Q")
+
+# A *.tmp file older than this belongs to a worker that died mid-publish
+TMP_MAX_AGE_SECONDS = 300
+
+
+def _align(n: int) -> int:
+    return (n + ALIGN - 1) // ALIGN * ALIGN
+
+
+class FrameCodec:
+    """
+    Stores a panel DataFrame as one float64 matrix plus the Date column.
+    Decoded frames are read-only views over the shared mapping.
+    """
+
+    kind = "frame"
+
+    @staticmethod
+    def encode(df: pd.DataFrame) -> tuple[dict, list[np.ndarray]]:
+        columns = [c for c in df.columns if c != "Date"]
+        values = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64))
+        dates = df["Date"].to_numpy(dtype="datetime64[ns]").view(np.int64)
+        return {"columns": columns}, [dates, values]
+
+    @staticmethod
+    def decode(meta: dict, blocks: list[np.ndarray]) -> pd.DataFrame:
+        dates, values = blocks
+        df = pd.DataFrame(values, columns=meta["columns"], copy=False)
+        df.insert(0, "Date", dates.view("datetime64[ns]"))
+        return df
+
+
+class JsonCodec:
+    """
+    Stores small JSON-serialisable results (e.g. ranked signals).
+    """
+
+    kind = "json"
+
+    @staticmethod
+    def encode(value: Any) -> tuple[dict, list[np.ndarray]]:
+        raw = json.dumps(value).encode()
+        return {}, [np.frombuffer(raw, dtype=np.uint8)]
+
+    @staticmethod
+    def decode(meta: dict, blocks: list[np.ndarray]) -> Any:
+        return json.loads(blocks[0].tobytes())
+
+
+class SharedStore:
+    """
+    Cross-process store backed by mmap'ed files on a tmpfs directory.
+
+    Each key is published once as an immutable segment and attached
+    zero-copy (read-only) by every worker on the host. A per-key flock
+    ensures a single worker computes a missing key while the others wait
+    and then attach to its result.
+
+    The directory is host RAM shared by every worker, so it is bounded to
+    max_segments segments and max_bytes in total: each publish evicts the
+    oldest segments (by mtime) beyond either limit. None disables a limit.
+    """
+
+    def __init__(self, directory: str, max_segments: int | None = None, max_bytes: int | None = None):
+        self.directory = directory
+        self.max_segments = max_segments
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def get_or_publish(self, key: Hashable, loader: Callable[[], Any], codec) -> Any:
+        """
+        Attach to the segment for key, computing and publishing it on a miss.
+
+        key must be a tuple whose first element is the as-of date.
+        """
+        path = self._path(key, codec)
+
+        value = self._attach(path, codec)
+        if value is not None:
+            return value
+
+        with self._locked(path):
+            # Another worker may have published while we waited
+            value = self._attach(path, codec)
+            if value is not None:
+                return value
+
+            fresh = loader()
+            self._publish(path, codec, fresh)
+            self._evict(keep=path)
+
+        value = self._attach(path, codec)
+        # Another worker's eviction may already have removed it
+        return fresh if value is None else value
+
+    def prune(self, as_of: date) -> int:
+        """
+        Remove segments (and lock files) published for other as-of dates,
+        plus temporary files abandoned by a worker that died while publishing.
+
+        Called at startup and whenever a cache sees the date roll over.
+        """
+        stamp = as_of.strftime("%Y%m%d")
+        now = time.time()
+        removed = 0
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            parts = name.split("-")
+            try:
+                if len(parts) >= 3 and parts[1] != stamp:
+                    os.unlink(path)
+                    removed += 1
+                elif name.endswith(".tmp") and now - os.path.getmtime(path) > TMP_MAX_AGE_SECONDS:
+                    os.unlink(path)
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def _evict(self, keep: str) -> int:
+        """
+        Remove the oldest segments until both limits hold, sparing keep.
+
+        Lock files go with their segment; lock files left by a loader that
+        failed (no segment) are removed once older than TMP_MAX_AGE_SECONDS.
+        Workers that still have an evicted segment mapped keep their view
+        until they drop it (bounded by their own LRU caches).
+        """
+        now = time.time()
+        segments, locks = [], []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if name.endswith(".lock"):
+                locks.append((st.st_mtime, path))
+            elif not name.endswith(".tmp"):
+                segments.append((st.st_mtime, st.st_size, path))
+
+        count = len(segments)
+        total = sum(size for _, size, _ in segments)
+        removed = 0
+
+        for _, size, path in sorted(segments):
+            over_count = self.max_segments is not None and count > self.max_segments
+            over_bytes = self.max_bytes is not None and total > self.max_bytes
+            if not (over_count or over_bytes):
+                break
+            if path == keep:
+                continue
+            for victim in (path, f"{path}.lock"):
+                try:
+                    os.unlink(victim)
+                except FileNotFoundError:
+                    pass
+            count -= 1
+            total -= size
+            removed += 1
+
+        for mtime, lock in locks:
+            if now - mtime > TMP_MAX_AGE_SECONDS and not os.path.exists(lock[:-len(".lock")]):
+                try:
+                    os.unlink(lock)
+                except FileNotFoundError:
+                    pass
+
+        return removed
+
+    def _path(self, key: Hashable, codec) -> str:
+        digest = hashlib.sha1(repr(key).encode()).hexdigest()[:24]
+        stamp = key[0].strftime("%Y%m%d")
+        return os.path.join(self.directory, f"{codec.kind}-{stamp}-{digest}")
+
+    @contextmanager
+    def _locked(self, path: str):
+        with open(f"{path}.lock", "a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _publish(path: str, codec, value: Any) -> None:
+        meta, arrays = codec.encode(value)
+
+        # Block offsets are relative to the first aligned byte after the header
+        offsets = []
+        offset = 0
+        for arr in arrays:
+            offsets.append(offset)
+            offset = _align(offset + arr.nbytes)
+
+        header = json.dumps({
+            **meta,
+            "blocks": [
+                {"dtype": arr.dtype.str, "shape": arr.shape, "offset": off}
+                for arr, off in zip(arrays, offsets)
+            ],
+        }).encode()
+        data_start = _align(_HEADER_LEN.size + len(header))
+
+        # Write under a private name, then rename: readers never see partial data
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(_HEADER_LEN.pack(len(header)))
+            fh.write(header)
+            for arr, off in zip(arrays, offsets):
+                fh.seek(data_start + off)
+                fh.write(arr.tobytes())
+            fh.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _attach(path: str, codec) -> Any | None:
+        try:
+            with open(path, "rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+        (header_len,) = _HEADER_LEN.unpack_from(mm, 0)
+        meta = json.loads(mm[_HEADER_LEN.size:_HEADER_LEN.size + header_len])
+        data_start = _align(_HEADER_LEN.size + header_len)
+
+        # The arrays keep the mapping alive for as long as they are referenced
+        blocks = [
+            np.frombuffer(
+                mm,
+                dtype=np.dtype(b["dtype"]),
+                count=int(np.prod(b["shape"])),
+                offset=data_start + b["offset"],
+            ).reshape(b["shape"])
+            for b in meta.pop("blocks")
+        ]
+        return codec.decode(meta, blocks)
@@ -0,0 +1,105 @@
+# app/services/signal/generator.py
+
+from datetime import datetime
+
+import pandas as pd
+
+from app.services.cache import signal_cache
+from app.services.market_data import MarketDataService, get_market_data_service
+from app.services.analytics.returns import DailyReturnsAnalyzer
+from app.services.analytics.monte_carlo import MonteCarloSimulator
+from app.services.signal.confidence import SignalConfidenceCalculator
+from app.services.signal.ranking import SignalRanker
+from app.services.scheduler import SimulationPlan, scheduler
+
+
+class SignalGenerator:
+    """
+    End-to-end signal pipeline: market data → returns → Monte Carlo → ranking.
+    """
+
+    @staticmethod
+    def market_data() -> MarketDataService:
+        """
+        Market data service covering the history used for simulation.
+        """
+        end = datetime.now()
+        start = datetime(end.year - 1, end.month, end.day)
+        return get_market_data_service(start, end)
+
+    @staticmethod
+    def generate(tickers: list[str], years: int, plan: SimulationPlan) -> list[dict]:
+        """
+        Ranked signal records for tickers, cached per trading day.
+
+        plan comes from scheduler.plan_signals(); simulation runs only on a
+        cache miss, and only once the scheduler admits it.
+        """
+        svc = SignalGenerator.market_data()
+
+        key = (svc.end.date(), svc.provider, tuple(tickers), years, plan.simulations, plan.mode)
+
+        return signal_cache.get_or_load(
+            key,
+            lambda: SignalGenerator._compute(svc, tickers, years, plan)
+        )
+
+    @staticmethod
+    def _compute(svc: MarketDataService, tickers: list[str], years: int, plan: SimulationPlan) -> list[dict]:
+        # 1. Load market data
+        panel_df = svc.load_panel(tickers)
+
+        # 2. Compute returns
+        panel_df = DailyReturnsAnalyzer.compute(panel_df, tickers)
+
+        with scheduler.admit(plan):
+            return SignalGenerator._score(panel_df, tickers, years, plan)
+
+    @staticmethod
+    def _score(panel_df: pd.DataFrame, tickers: list[str], years: int, plan: SimulationPlan) -> list[dict]:
+        simulate = (
+            MonteCarloSimulator.simulate_terminal
+            if plan.terminal_only
+            else MonteCarloSimulator.simulate
+        )
+
+        signals = []
+
+        for ticker in tickers:
+            # 3. Monte Carlo simulation
+            sim_df = simulate(
+                panel_df,
+                ticker=ticker,
+                years=years,
+                simulations=plan.simulations
+            )
+
+            current_price = panel_df[f"Close_{ticker}"].iloc[-1]
+
+            # 4. Confidence metrics
+            metrics = SignalConfidenceCalculator.from_monte_carlo(
+                current_price,
+                sim_df
+            )
+
+            # Using current baseline confidence logic
+            confidence = abs(metrics["expected_return"]) * (1 - metrics["prob_loss"])
+
+            decision = SignalRanker.classify({
+                **metrics,
+                "confidence": confidence
+            })
+
+            signals.append({
+                "ticker": ticker,
+                "current_price": float(current_price),
+                "expected_return": metrics["expected_return"],
+                "expected_price": float(current_price * (1 + metrics["expected_return"])),
+                "prob_gain": metrics["prob_gain"],
+                "prob_loss": metrics["prob_loss"],
+                "downside_95": metrics["downside_pct_95"],
+                "signal": decision["signal"],
+                "confidence": round(confidence, 4)
+            })
+
+        return SignalRanker.rank(signals)
@@ -0,0 +1,70 @@
+# app/services/synthetic_data.py
+
+import time
+import zlib
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from app.services.market_data import MarketDataService
+
+
+class SyntheticMarketDataService(MarketDataService):
+    """
+    Offline stand-in for Yahoo Finance, used for load tests and local runs.
+
+    Produces deterministic OHLCV panels shaped exactly like yf.download output:
+    the same ticker and date range always yield the same prices.
+    """
+
+    provider = "synthetic"
+
+    def __init__(self, start: datetime, end: datetime, latency_ms: float = 0.0):
+        super().__init__(start, end)
+        self.latency_ms = latency_ms
+
+    def _download(self, tickers: str | list[str]) -> pd.DataFrame:
+        if isinstance(tickers, str):
+            tickers = [tickers]
+
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+        dates = pd.bdate_range(self.start.date(), self.end.date(), name="Date")
+        frames = {ticker: self._ohlcv(ticker, len(dates)) for ticker in tickers}
+
+        # yfinance layout: (Price, Ticker) column MultiIndex
+        df = pd.concat(frames, axis=1).swaplevel(axis=1).sort_index(axis=1)
+        df.columns.names = ["Price", "Ticker"]
+        df.index = dates
+        return df
+
+    @staticmethod
+    def _ohlcv(ticker: str, n_days: int) -> pd.DataFrame:
+        """
+        Geometric Brownian motion closes with plausible intraday ranges.
+        """
+        rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+
+        start_price = rng.uniform(20, 500)
+        mu = rng.uniform(-0.10, 0.25) / 252
+        sigma = rng.uniform(0.15, 0.60) / np.sqrt(252)
+
+        close = start_price * np.exp(np.cumsum(rng.normal(mu, sigma, n_days)))
+        prev_close = np.concatenate(([start_price], close[:-1]))
+        open_ = prev_close * (1 + rng.normal(0, sigma / 4, n_days))
+
+        wick = np.abs(rng.normal(0, sigma / 2, (2, n_days)))
+        high = np.maximum(open_, close) * (1 + wick[0])
+        low = np.minimum(open_, close) * (1 - wick[1])
+
+        volume = rng.integers(1_000_000, 50_000_000, n_days)
+
+        return pd.DataFrame({
+            "Close": close,
+            "High": high,
+            "Low": low,
+            "Open": open_,
+            "Volume": volume,
+        })
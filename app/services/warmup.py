@@ -0,0 +1,86 @@
+# app/services/warmup.py
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from app.config import Settings
+from app.services import cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmupState:
+    """
+    Startup progress, reported by the /ready endpoint.
+    """
+    ready: bool = False
+    import_seconds: float | None = None
+    boot_to_ready_seconds: float | None = None
+    warmup_seconds: float | None = None
+    restored_entries: int = 0
+    warmed_tickers: int = 0
+    error: str | None = None
+
+
+state = WarmupState()
+
+
+def run(settings: Settings, boot_time: float) -> WarmupState:
+    """
+    Restore the persisted snapshot and pre-warm the configured watchlist.
+
+    boot_time is the time.perf_counter() value taken when the app started
+    importing; it is used to report boot → ready latency.
+    Failures are logged and recorded, the service still becomes ready.
+    """
+    started = time.perf_counter()
+    as_of = date.today()
+
+    try:
+        if settings.shared_dir:
+            cache.enable_shared_store(settings.shared_dir)
+
+        state.restored_entries = cache.restore_snapshot(settings.snapshot_path, as_of)
+
+        # Import the heavy stack here rather than on the first request
+        from app.services.market_data import get_market_data_service
+        from app.services.scheduler import scheduler
+        from app.services.signal.generator import SignalGenerator
+
+        if settings.warmup_tickers:
+            # Single-ticker panels back /prices and /returns
+            end = datetime.now()
+            start = datetime(end.year - settings.warmup_years, end.month, end.day)
+            svc = get_market_data_service(start, end)
+            for ticker in settings.warmup_tickers:
+                svc.load_panel([ticker])
+
+            plan = scheduler.plan_signals(
+                len(settings.warmup_tickers),
+                settings.warmup_years,
+                settings.warmup_simulations
+            )
+            SignalGenerator.generate(settings.warmup_tickers, settings.warmup_years, plan)
+            state.warmed_tickers = len(settings.warmup_tickers)
+            cache.save_snapshot(settings.snapshot_path)
+
+    except Exception as exc:
+        logger.exception("Warm-up failed")
+        state.error = str(exc)
+
+    finished = time.perf_counter()
+    state.warmup_seconds = round(finished - started, 4)
+    state.boot_to_ready_seconds = round(finished - boot_time, 4)
+    state.ready = True
+
+    logger.info(
+        "Warm-up done in %.2fs (boot → ready %.2fs, %d entries restored, %d tickers warmed)",
+        state.warmup_seconds,
+        state.boot_to_ready_seconds,
+        state.restored_entries,
+        state.warmed_tickers,
+    )
+    return state
@@ -9,6 +9,37 @@ import seaborn as sns
 
 API_URL = "http://127.0.0.1:8000"
 
+# Roughly the pixel width of the price chart
+MAX_CHART_POINTS = 1000
+
+
+def api_get_json(path: str, params: dict | None = None):
+    """
+    GET an API endpoint, revalidating with If-None-Match.
+
+    Bodies are kept per URL with their ETag; a 304 reuses the stored body.
+    Returns None on any other non-200 status.
+    """
+    url = requests.Request("GET", f"{API_URL}{path}", params=params).prepare().url
+    etag_cache = st.session_state.setdefault("etag_cache", {})
+
+    headers = {}
+    if url in etag_cache:
+        headers["If-None-Match"] = etag_cache[url][0]
+
+    response = requests.get(url, headers=headers)
+
+    if response.status_code == 304:
+        return etag_cache[url][1]
+    if response.status_code != 200:
+        return None
+
+    body = response.json()
+    if "ETag" in response.headers:
+        etag_cache[url] = (response.headers["ETag"], body)
+    return body
+
+
 # ---------------------------------
 # Page config
 # ---------------------------------
@@ -59,15 +90,15 @@ if run_button:
     }
 
     with st.spinner("Running simulations..."):
-        response = requests.get(f"{API_URL}/signals", params=params)
+        signals = api_get_json("/signals", params)
 
-    if response.status_code != 200:
+    if signals is None:
         st.error("❌ Failed to fetch signals from API")
         st.stop()
 
     # ✅ Persist results across reruns
     st.session_state["signals_df"] = pd.DataFrame(
-        response.json()["signals"]
+        signals["signals"]
     )
 
 # ---------------------------------
@@ -172,12 +203,16 @@ st.metric(
 )
 
 #-------------------------------------------------------------------------
-returns_response = requests.get(
-    f"{API_URL}/returns/{selected_ticker}",
-    params={"years": years}
+returns_data = api_get_json(
+    f"/returns/{selected_ticker}",
+    {"years": years}
 )
 
-returns_df = pd.Series(returns_response.json()["returns"])
+if returns_data is None:
+    st.error("❌ Failed to fetch returns from API")
+    st.stop()
+
+returns_df = pd.Series(returns_data["returns"])
 
 tab1, tab2, tab3, tab4 = st.tabs(
     ["📈 Price & Trend", "📉 Returns", "⚠️ Risk (VaR)", "🔮 Monte Carlo"]
@@ -186,19 +221,26 @@ tab1, tab2, tab3, tab4 = st.tabs(
 with tab1:
     st.subheader(f"{selected_ticker} - Price & Trend")
 
-    price_resp = requests.get(
-        f"{API_URL}/prices/{selected_ticker}",
-        params={"years": years}
+    # Server-side downsampling keeps the plot bounded to ~1 point per pixel
+    price_data = api_get_json(
+        f"/prices/{selected_ticker}",
+        {"years": years, "max_points": MAX_CHART_POINTS, "format": "columnar"}
     )
-    
-    price_data = price_resp.json()
-    dates = price_data["dates"]
+
+    if price_data is None:
+        st.error("❌ Failed to fetch prices from API")
+        st.stop()
+
+    price_df = pd.DataFrame(
+        dict(zip(price_data["columns"], price_data["data"]))
+    )
+    dates = pd.to_datetime(price_df["date"])
 
     fig, ax = plt.subplots(figsize=(10, 4))
 
-    ax.plot(dates, price_data["prices"], label="Price", linewidth=2)
-    ax.plot(dates, price_data["sma20"], label="20D SMA", linestyle="--")
-    ax.plot(dates, price_data["sma50"], label="50D SMA", linestyle="--")
+    ax.plot(dates, price_df["price"], label="Price", linewidth=2)
+    ax.plot(dates, price_df["sma20"], label="20D SMA", linestyle="--")
+    ax.plot(dates, price_df["sma50"], label="50D SMA", linestyle="--")
 
     ax.set_title(f"{selected_ticker} Price & Trend")
     ax.xaxis.set_major_locator(mdates.AutoDateLocator())
@@ -0,0 +1,104 @@
+# benchmarks/cold_start.py
+"""
+Measure cold-start cost of the API.
+
+Reports, as JSON:
+- import_seconds: wall time of `import app.main` in a fresh interpreter
+- boot_to_ready_seconds: uvicorn spawn → /ready answering 200
+- first_response_seconds / second_response_seconds: /signals latency
+  for the warm-up watchlist right after readiness
+
+The /signals request is built from app.config.Settings (MT_WARMUP_TICKERS,
+MT_WARMUP_YEARS, MT_WARMUP_SIMULATIONS), the same values the server warms up
+with, so the first response should hit the warm cache. Without a watchlist
+it requests AAPL, which measures a cold request instead.
+
+Usage:
+    MT_WARMUP_TICKERS=NVDA,AAPL python benchmarks/cold_start.py --port 8011
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.config import Settings  # noqa: E402
+
+
+def measure_import() -> float:
+    code = (
+        "import time; t = time.perf_counter(); import app.main; "
+        "print(time.perf_counter() - t)"
+    )
+    out = subprocess.check_output([sys.executable, "-c", code], cwd=ROOT, text=True)
+    return float(out.strip().splitlines()[-1])
+
+
+def wait_ready(url: str, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if requests.get(f"{url}/ready", timeout=1).status_code == 200:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"{url} not ready after {timeout}s")
+
+
+def timed_get(url: str, params: dict) -> float:
+    t = time.perf_counter()
+    requests.get(url, params=params, timeout=300).raise_for_status()
+    return time.perf_counter() - t
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--timeout", type=float, default=300)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    s = Settings()
+    url = f"http://127.0.0.1:{args.port}"
+
+    result = {"import_seconds": round(measure_import(), 4)}
+
+    spawned = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(args.port)],
+        cwd=ROOT,
+    )
+    try:
+        wait_ready(url, args.timeout)
+        result["boot_to_ready_seconds"] = round(time.perf_counter() - spawned, 4)
+        result["server"] = requests.get(f"{url}/ready", timeout=5).json()
+
+        params = {
+            "tickers": s.warmup_tickers or ["AAPL"],
+            "years": s.warmup_years,
+            "simulations": s.warmup_simulations,
+        }
+        result["first_response_seconds"] = round(timed_get(f"{url}/signals", params), 4)
+        result["second_response_seconds"] = round(timed_get(f"{url}/signals", params), 4)
+    finally:
+        server.terminate()
+        server.wait()
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,330 @@
+# benchmarks/loadtest.py
+"""
+End-to-end load test of app.main:app against the synthetic market data provider.
+
+Boots uvicorn with MT_MARKET_DATA_PROVIDER=synthetic, waits for /ready, then
+drives a weighted mix of /signals, /prices, /returns and /monte-carlo traffic
+from --concurrency client threads for --duration seconds.
+
+Reports per endpoint: request count, errors, requests/sec and p50/p95/p99
+latency (ms). Server memory is reported for the whole run, not per endpoint:
+a background thread samples the proportional set size (PSS, so pages shared
+between workers or mapped from MT_SHARED_DIR are not counted twice) summed
+over the uvicorn process tree every --sample-interval seconds. Results are
+written as JSON so runs can be diffed across versions.
+
+Usage:
+    python benchmarks/loadtest.py --concurrency 16 --duration 30 \\
+        --mix signals=1,prices=4,returns=4,monte-carlo=1 --output load.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TICKERS = ["AAPL", "MSFT", "NVDA", "GOOG", "AMZN", "META", "TSLA", "JPM", "XOM", "KO"]
+
+ENDPOINTS = ("signals", "prices", "returns", "monte-carlo")
+
+
+def build_request(endpoint: str, rng: random.Random, args) -> tuple[str, dict]:
+    """
+    Path and query parameters for one request of the given endpoint.
+    """
+    ticker = rng.choice(TICKERS)
+
+    if endpoint == "signals":
+        tickers = rng.sample(TICKERS, args.signal_tickers)
+        return "/signals", {"tickers": tickers, "years": args.years, "simulations": args.simulations}
+    if endpoint == "prices":
+        return f"/prices/{ticker}", {"years": args.years}
+    if endpoint == "returns":
+        return f"/returns/{ticker}", {"years": args.years}
+    return f"/monte-carlo/{ticker}", {"years": args.years, "simulations": args.mc_simulations}
+
+
+def process_tree(root_pid: int) -> list[int]:
+    """
+    root_pid and all its descendants (Linux /proc).
+    """
+    children: dict[int, list[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as fh:
+                ppid = int(fh.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+
+    pids = []
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        pids.append(pid)
+        stack.extend(children.get(pid, []))
+    return pids
+
+
+def _read_kb(path: str, field: str) -> int | None:
+    try:
+        with open(path) as fh:
+            for line in fh:
+                if line.startswith(field):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def process_memory_kb(pid: int) -> tuple[str, int | None]:
+    """
+    PSS of pid from smaps_rollup, or VmRSS on kernels without it (< 4.14).
+    """
+    pss = _read_kb(f"/proc/{pid}/smaps_rollup", "Pss:")
+    if pss is not None:
+        return "pss", pss
+    return "rss", _read_kb(f"/proc/{pid}/status", "VmRSS:")
+
+
+class MemorySampler(threading.Thread):
+    """
+    Samples the memory of a process tree at a fixed interval until stopped.
+    """
+
+    def __init__(self, root_pid: int, interval: float):
+        super().__init__(daemon=True)
+        self.root_pid = root_pid
+        self.interval = interval
+        self.metric = "pss"
+        self.samples: list[float] = []
+        self._stop_event = threading.Event()
+
+    def sample(self) -> float:
+        total_kb = 0
+        for pid in process_tree(self.root_pid):
+            metric, kb = process_memory_kb(pid)
+            if kb is None:
+                continue
+            if metric == "rss":
+                self.metric = "rss"
+            total_kb += kb
+        return total_kb / 1024
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self.interval):
+            self.samples.append(self.sample())
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        self.join()
+
+
+def percentile(sorted_values: list[float], pct: float) -> float | None:
+    """
+    Nearest-rank percentile of an already sorted list.
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, int(round(pct / 100 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 2)
+
+
+def parse_mix(raw: str) -> dict[str, float]:
+    mix = {}
+    for part in raw.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ENDPOINTS:
+            raise argparse.ArgumentTypeError(f"Unknown endpoint in mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def wait_ready(url: str, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if requests.get(f"{url}/ready", timeout=1).status_code == 200:
+                return
+        except requests.ConnectionError:
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"{url} not ready after {timeout}s")
+
+
+def run_client(worker_id: int, url: str, deadline: float, args, records: list, lock: threading.Lock) -> None:
+    rng = random.Random(args.seed + worker_id)
+    names = list(args.mix)
+    weights = [args.mix[n] for n in names]
+    session = requests.Session()
+
+    while time.perf_counter() < deadline:
+        endpoint = rng.choices(names, weights)[0]
+        path, params = build_request(endpoint, rng, args)
+
+        t = time.perf_counter()
+        try:
+            status = session.get(f"{url}{path}", params=params, timeout=args.request_timeout).status_code
+        except requests.RequestException:
+            status = None
+        latency = time.perf_counter() - t
+
+        with lock:
+            records.append((endpoint, latency, status))
+
+
+def summarize(records: list, elapsed: float) -> dict:
+    def stats(rows: list) -> dict:
+        latencies = sorted(r[1] * 1000 for r in rows)
+        errors = sum(1 for r in rows if r[2] != 200)
+        return {
+            "requests": len(rows),
+            "errors": errors,
+            "status_counts": {
+                str(s): sum(1 for r in rows if r[2] == s) for s in sorted({r[2] for r in rows}, key=str)
+            },
+            "rps": round(len(rows) / elapsed, 2),
+            "p50_ms": _round(percentile(latencies, 50)),
+            "p95_ms": _round(percentile(latencies, 95)),
+            "p99_ms": _round(percentile(latencies, 99)),
+        }
+
+    endpoints = {
+        name: stats([r for r in records if r[0] == name])
+        for name in ENDPOINTS
+        if any(r[0] == name for r in records)
+    }
+    return {"endpoints": endpoints, "total": stats(records)}
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8012)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--concurrency", type=int, default=8, help="client threads")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of traffic")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("signals=1,prices=4,returns=4,monte-carlo=1"))
+    parser.add_argument("--years", type=int, default=1)
+    parser.add_argument("--simulations", type=int, default=500)
+    parser.add_argument("--mc-simulations", type=int, default=300)
+    parser.add_argument("--signal-tickers", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=50, help="synthetic download latency")
+    parser.add_argument("--request-timeout", type=float, default=120)
+    parser.add_argument("--ready-timeout", type=float, default=120)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--sample-interval", type=float, default=0.25, help="seconds between memory samples")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    url = f"http://127.0.0.1:{args.port}"
+    # Fresh snapshot path: every run starts cold and leaves the real snapshot alone
+    snapshot_dir = tempfile.mkdtemp(prefix="mt-loadtest-")
+    env = {
+        **os.environ,
+        "MT_MARKET_DATA_PROVIDER": "synthetic",
+        "MT_SYNTHETIC_LATENCY_MS": str(args.latency_ms),
+        "MT_SNAPSHOT_PATH": os.path.join(snapshot_dir, "snapshot.pkl"),
+        "MT_WORKERS": str(args.workers),
+    }
+
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(args.port),
+            "--workers", str(args.workers),
+            "--log-level", "warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+
+    records: list = []
+    lock = threading.Lock()
+    try:
+        wait_ready(url, args.ready_timeout)
+        sampler = MemorySampler(server.pid, args.sample_interval)
+        baseline_mb = sampler.sample()
+
+        started = time.perf_counter()
+        deadline = started + args.duration
+        sampler.start()
+        try:
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                futures = [
+                    pool.submit(run_client, i, url, deadline, args, records, lock)
+                    for i in range(args.concurrency)
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            sampler.stop()
+        elapsed = time.perf_counter() - started
+    finally:
+        server.terminate()
+        server.wait()
+        shutil.rmtree(snapshot_dir, ignore_errors=True)
+
+    result = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "workers": args.workers,
+            "concurrency": args.concurrency,
+            "duration_s": round(elapsed, 2),
+            "mix": args.mix,
+            "years": args.years,
+            "simulations": args.simulations,
+            "mc_simulations": args.mc_simulations,
+            "signal_tickers": args.signal_tickers,
+            "synthetic_latency_ms": args.latency_ms,
+        },
+        "server_memory": {
+            "metric": sampler.metric,
+            "samples": len(sampler.samples),
+            "interval_s": args.sample_interval,
+            "baseline_mb": round(baseline_mb, 1),
+            "mean_mb": round(sum(sampler.samples) / len(sampler.samples), 1) if sampler.samples else None,
+            "peak_mb": round(max(sampler.samples, default=baseline_mb), 1),
+        },
+        **summarize(records, elapsed),
+    }
+
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as fh:
+            fh.write(text)
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+# tests/conftest.py
+
+import os
+import tempfile
+
+import pytest
+
+# Settings are read once at import time: configure before app modules load
+os.environ.setdefault("MT_MARKET_DATA_PROVIDER", "synthetic")
+os.environ.setdefault(
+    "MT_SNAPSHOT_PATH",
+    os.path.join(tempfile.mkdtemp(prefix="mt-tests-"), "snapshot.pkl")
+)
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,56 @@
+# tests/test_cache.py
+
+from datetime import date
+
+from app.services.cache import ResultCache
+
+DAY_1 = date(2026, 1, 5)
+DAY_2 = date(2026, 1, 6)
+
+
+def test_get_or_load_calls_loader_once():
+    cache = ResultCache("test", max_entries=8)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "value"
+
+    assert cache.get_or_load((DAY_1, "a"), loader) == "value"
+    assert cache.get_or_load((DAY_1, "a"), loader) == "value"
+    assert len(calls) == 1
+
+
+def test_new_day_drops_previous_day_entries():
+    cache = ResultCache("test", max_entries=8)
+    cache.set((DAY_1, "a"), 1)
+    cache.set((DAY_1, "b"), 2)
+
+    cache.set((DAY_2, "a"), 3)
+
+    assert cache.get((DAY_1, "a")) is None
+    assert cache.get((DAY_1, "b")) is None
+    assert cache.get((DAY_2, "a")) == 3
+    assert len(cache) == 1
+
+
+def test_older_key_does_not_evict_current_day():
+    cache = ResultCache("test", max_entries=8)
+    cache.set((DAY_2, "a"), 1)
+    cache.set((DAY_1, "a"), 2)
+
+    assert cache.get((DAY_2, "a")) == 1
+
+
+def test_lru_bound_evicts_least_recently_used():
+    cache = ResultCache("test", max_entries=2)
+    cache.set((DAY_1, "a"), 1)
+    cache.set((DAY_1, "b"), 2)
+    cache.get((DAY_1, "a"))
+
+    cache.set((DAY_1, "c"), 3)
+
+    assert len(cache) == 2
+    assert cache.get((DAY_1, "b")) is None
+    assert cache.get((DAY_1, "a")) == 1
+    assert cache.get((DAY_1, "c")) == 3
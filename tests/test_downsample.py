@@ -0,0 +1,57 @@
+# tests/test_downsample.py
+
+import numpy as np
+import pytest
+
+from app.services.analytics.downsample import Downsampler
+
+
+@pytest.fixture
+def series():
+    rng = np.random.default_rng(7)
+    return 100 + rng.standard_normal(1_000).cumsum()
+
+
+@pytest.mark.parametrize("method", Downsampler.METHODS)
+@pytest.mark.parametrize("max_points", [3, 4, 5, 10, 101, 999])
+def test_indices_respect_max_points(series, method, max_points):
+    idx = Downsampler.indices(series, max_points, method)
+
+    assert 0 < len(idx) <= max_points
+    assert idx[0] == 0
+    assert idx[-1] == len(series) - 1
+    assert np.all(np.diff(idx) > 0)
+
+
+@pytest.mark.parametrize("method", Downsampler.METHODS)
+def test_short_series_returned_unchanged(series, method):
+    idx = Downsampler.indices(series[:20], 50, method)
+    np.testing.assert_array_equal(idx, np.arange(20))
+
+
+def test_minmax_keeps_global_extremes(series):
+    idx = Downsampler.minmax_indices(series, 50)
+
+    assert int(np.argmin(series)) in idx
+    assert int(np.argmax(series)) in idx
+
+
+def test_lttb_rejects_fewer_than_three_points(series):
+    with pytest.raises(ValueError):
+        Downsampler.lttb_indices(series, 2)
+
+
+def test_unknown_method_rejected(series):
+    with pytest.raises(ValueError):
+        Downsampler.indices(series, 10, "average")
+
+
+@pytest.mark.parametrize("method", Downsampler.METHODS)
+def test_prices_route_downsamples_to_max_points(client, method):
+    response = client.get(
+        "/prices/AAPL",
+        params={"years": 5, "max_points": 3, "method": method, "format": "columnar"},
+    )
+
+    assert response.status_code == 200
+    assert len(response.json()["data"][0]) <= 3
@@ -0,0 +1,122 @@
+# tests/test_http_cache.py
+
+import time
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+import pytest
+from starlette.requests import Request
+
+from app.api.http_cache import (
+    compute_etag,
+    is_not_modified,
+    max_age,
+    seconds_until_cache_rollover,
+    seconds_until_next_bar,
+)
+
+NY = ZoneInfo("America/New_York")
+HOUR = 3600
+
+
+@pytest.fixture
+def server_tz(monkeypatch):
+    """
+    Sets the server's local time zone for the duration of a test.
+    """
+    def set_tz(name: str) -> None:
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+
+    yield set_tz
+    monkeypatch.undo()
+    time.tzset()
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_etag_ignores_ticker_order_and_duplicates():
+    a = compute_etag("signals", ["MSFT", "AAPL"], "2026-10-16", {"years": 1})
+    b = compute_etag("signals", ["AAPL", "MSFT", "AAPL"], "2026-10-16", {"years": 1})
+
+    assert a == b
+    assert a.startswith('W/"')
+
+
+def test_etag_changes_with_new_bar_and_params():
+    base = compute_etag("prices", ["AAPL"], "2026-10-16", {"years": 1})
+
+    assert base != compute_etag("prices", ["AAPL"], "2026-10-19", {"years": 1})
+    assert base != compute_etag("prices", ["AAPL"], "2026-10-16", {"years": 2})
+    assert base != compute_etag("returns", ["AAPL"], "2026-10-16", {"years": 1})
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, False),
+    ('W/"abc"', True),
+    ('"abc"', True),
+    ('"xyz", W/"abc"', True),
+    ('"xyz"', False),
+    ("*", True),
+])
+def test_if_none_match(header, expected):
+    assert is_not_modified(make_request(header), 'W/"abc"') is expected
+
+
+@pytest.mark.parametrize("now, hours", [
+    (datetime(2026, 10, 19, 10, 0, tzinfo=NY), 6.5),    # Monday before the bar
+    (datetime(2026, 10, 19, 17, 0, tzinfo=NY), 23.5),   # Monday after the bar
+    (datetime(2026, 10, 16, 17, 0, tzinfo=NY), 71.5),   # Friday evening → Monday
+    (datetime(2026, 10, 17, 12, 0, tzinfo=NY), 52.5),   # Saturday → Monday
+    (datetime(2026, 10, 30, 17, 0, tzinfo=NY), 72.5),   # weekend with DST ending
+])
+def test_seconds_until_next_bar(now, hours):
+    assert seconds_until_next_bar(now) == hours * HOUR
+
+
+def test_seconds_until_next_bar_converts_timezones():
+    now = datetime(2026, 10, 17, 16, 0, tzinfo=ZoneInfo("UTC"))  # Saturday 12:00 in New York
+    assert seconds_until_next_bar(now) == 52.5 * HOUR
+
+
+@pytest.mark.parametrize("tz, hours", [
+    ("America/New_York", 7.25),
+    ("UTC", 3.25),
+    ("Asia/Tokyo", 18.25),
+])
+def test_after_close_revalidation_expires_at_cache_rollover(server_tz, tz, hours):
+    # Just after the bar: the server still serves this morning's panel and
+    # only reloads at its local midnight, long before the next bar at 16:30
+    server_tz(tz)
+    now = datetime(2026, 10, 19, 16, 45, tzinfo=NY)
+
+    assert seconds_until_next_bar(now) == 23.75 * HOUR
+    assert seconds_until_cache_rollover(now) == hours * HOUR
+    assert max_age(now) == hours * HOUR
+
+
+def test_max_age_follows_next_bar_before_rollover(server_tz):
+    server_tz("America/New_York")
+    now = datetime(2026, 10, 19, 10, 0, tzinfo=NY)
+
+    assert max_age(now) == 6.5 * HOUR
+
+
+def test_not_modified_and_gzip(client):
+    first = client.get("/returns/AAPL", headers={"Accept-Encoding": "gzip"})
+
+    assert first.status_code == 200
+    assert first.headers["content-encoding"] == "gzip"
+    assert "max-age=" in first.headers["cache-control"]
+
+    second = client.get("/returns/AAPL", headers={"If-None-Match": first.headers["etag"]})
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert second.content == b""
+
+    max_age_header = int(second.headers["cache-control"].rsplit("=", 1)[1])
+    assert max_age_header <= seconds_until_cache_rollover()
@@ -0,0 +1,44 @@
+# tests/test_lifespan.py
+
+import threading
+import time
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.main as main
+from app.services import cache, warmup
+
+
+@pytest.fixture
+def saved(monkeypatch):
+    calls = []
+    monkeypatch.setattr(cache, "save_snapshot", calls.append)
+    monkeypatch.setattr(main, "settings", replace(main.settings, warmup_shutdown_timeout=0.2))
+    return calls
+
+
+def test_shutdown_saves_snapshot_after_warmup(monkeypatch, saved):
+    monkeypatch.setattr(warmup, "run", lambda settings, boot_time: None)
+
+    with TestClient(main.app):
+        pass
+
+    assert saved == [main.settings.snapshot_path]
+
+
+def test_shutdown_does_not_wait_for_hung_warmup(monkeypatch, saved, caplog):
+    release = threading.Event()
+    monkeypatch.setattr(warmup, "run", lambda settings, boot_time: release.wait())
+
+    started = time.perf_counter()
+    try:
+        with TestClient(main.app):
+            pass
+    finally:
+        release.set()
+
+    assert time.perf_counter() - started < 2
+    assert saved == []
+    assert "without saving the snapshot" in caplog.text
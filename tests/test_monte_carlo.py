@@ -0,0 +1,61 @@
+# tests/test_monte_carlo.py
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.services.analytics.monte_carlo import MonteCarloSimulator
+from app.services.synthetic_data import SyntheticMarketDataService
+
+
+@pytest.fixture
+def panel():
+    svc = SyntheticMarketDataService(datetime(2025, 1, 1), datetime(2026, 1, 1))
+    return svc._download_panel(["AAPL"])
+
+
+@pytest.mark.parametrize("years, simulations", [(1, 200), (2, 333)])
+def test_terminal_only_matches_last_row_of_full_paths(panel, years, simulations):
+    full = MonteCarloSimulator.simulate(panel, "AAPL", years, simulations)
+    terminal = MonteCarloSimulator.simulate_terminal(panel, "AAPL", years, simulations)
+
+    assert terminal.shape == (1, simulations)
+    np.testing.assert_allclose(terminal.iloc[-1], full.iloc[-1], rtol=1e-12)
+
+
+def test_simulate_shape(panel):
+    assert MonteCarloSimulator.simulate(panel, "AAPL", 1, 50).shape == (252, 50)
+
+
+def test_missing_ticker_raises(panel):
+    with pytest.raises(KeyError):
+        MonteCarloSimulator.simulate_terminal(panel, "MSFT", 1, 10)
+
+
+def test_same_stream_as_global_seeding(panel):
+    # Results cached by earlier releases stay valid
+    np.random.seed(42)
+    rand = np.random.normal(loc=0, scale=1, size=(252, 20))
+    sim = MonteCarloSimulator.simulate(panel, "AAPL", 1, 20)
+
+    last_price, mu, sigma = MonteCarloSimulator._gbm_params(panel, "AAPL")
+    dt = 1 / 252
+    expected = last_price * np.exp(np.cumsum((mu - 0.5 * sigma**2) * dt + sigma * np.sqrt(dt) * rand, axis=0))
+    np.testing.assert_allclose(sim.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("simulate", [MonteCarloSimulator.simulate, MonteCarloSimulator.simulate_terminal])
+def test_concurrent_simulations_are_deterministic(panel, simulate):
+    expected = simulate(panel, "AAPL", 2, 2_000).iloc[-1].to_numpy()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(simulate, panel, "AAPL", 2, 2_000) for _ in range(8)]
+        # Unseeded global draws in parallel must not disturb the simulations
+        for _ in range(200):
+            np.random.normal(size=1_000)
+        results = [f.result().iloc[-1].to_numpy() for f in futures]
+
+    for result in results:
+        np.testing.assert_array_equal(result, expected)
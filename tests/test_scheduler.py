@@ -0,0 +1,174 @@
+# tests/test_scheduler.py
+
+import threading
+import time
+from dataclasses import replace
+
+import pytest
+
+from app.config import Settings
+from app.services.scheduler import AdmissionRejected, SIMULATION_THREADS, SimulationScheduler
+
+MB = 1024 * 1024
+
+
+def test_from_settings_splits_budget_between_workers():
+    s = replace(Settings(), workers=4, sim_memory_budget_mb=1024, sim_max_concurrent=8)
+    scheduler = SimulationScheduler.from_settings(s)
+
+    assert scheduler.memory_budget_bytes == 256 * MB
+    assert scheduler.max_concurrent == 2
+
+
+def test_from_settings_keeps_at_least_one_slot_per_worker():
+    s = replace(Settings(), workers=16, sim_max_concurrent=4)
+    assert SimulationScheduler.from_settings(s).max_concurrent == 1
+
+
+def test_from_settings_leaves_threads_for_cheap_requests():
+    s = replace(Settings(), workers=1, sim_max_concurrent=64, sim_max_queue=16)
+    scheduler = SimulationScheduler.from_settings(s)
+
+    assert scheduler.max_concurrent + scheduler.max_queue <= SIMULATION_THREADS
+    assert scheduler.max_concurrent >= 1
+
+
+def make_scheduler(**overrides) -> SimulationScheduler:
+    params = dict(
+        memory_budget_bytes=64 * MB,
+        job_memory_bytes=16 * MB,
+        max_cells=10_000_000,
+        max_simulations=5_000,
+        min_simulations=100,
+        max_concurrent=1,
+        max_queue=2,
+        queue_timeout=0.2,
+    )
+    params.update(overrides)
+    return SimulationScheduler(**params)
+
+
+@pytest.mark.parametrize("years, simulations", [(1, 0), (1, -5), (0, 500), (-1, 500)])
+def test_plans_reject_non_positive_inputs(years, simulations):
+    scheduler = make_scheduler()
+
+    with pytest.raises(ValueError):
+        scheduler.plan_signals(1, years, simulations)
+    with pytest.raises(ValueError):
+        scheduler.plan_paths(years, simulations)
+
+
+@pytest.mark.parametrize("params", [
+    {"simulations": 0},
+    {"simulations": -5},
+    {"years": 0},
+])
+@pytest.mark.parametrize("path", ["/signals", "/monte-carlo/AAPL"])
+def test_routes_reject_non_positive_inputs(client, path, params):
+    response = client.get(path, params={"tickers": ["AAPL"], **params})
+    assert response.status_code == 422
+
+
+def test_small_signals_request_runs_full_paths_unchanged():
+    plan = make_scheduler().plan_signals(3, 1, 500)
+
+    assert plan.simulations == 500
+    assert plan.mode == "paths"
+    assert not plan.downgraded
+    assert plan.cells == 3 * 252 * 500
+
+
+def test_large_signals_request_switches_to_terminal_only():
+    scheduler = make_scheduler()
+    plan = scheduler.plan_signals(1, 3, 5_000)
+
+    assert plan.mode == "terminal"
+    assert plan.downgraded
+    assert plan.memory_bytes <= scheduler.job_memory_bytes
+
+
+def test_signals_simulations_reduced_to_fit_cell_budget():
+    scheduler = make_scheduler(max_cells=252 * 1_000)
+    plan = scheduler.plan_signals(2, 1, 5_000)
+
+    assert plan.simulations == 500
+    assert plan.cells <= scheduler.max_cells
+
+
+def test_paths_request_reduced_to_fit_job_memory():
+    scheduler = make_scheduler()
+    plan = scheduler.plan_paths(1, 5_000)
+
+    assert plan.downgraded
+    assert plan.mode == "paths"
+    assert plan.memory_bytes <= scheduler.job_memory_bytes
+
+
+def test_request_too_large_at_minimum_simulations_is_rejected():
+    scheduler = make_scheduler(max_cells=1_000)
+
+    with pytest.raises(AdmissionRejected) as exc:
+        scheduler.plan_signals(10, 1, 500)
+    assert exc.value.status_code == 429
+
+
+def test_admit_times_out_with_503_and_retry_after():
+    scheduler = make_scheduler(queue_timeout=0.05)
+    plan = scheduler.plan_signals(1, 1, 100)
+
+    with scheduler.admit(plan):
+        with pytest.raises(AdmissionRejected) as exc:
+            with scheduler.admit(plan):
+                pass
+
+    assert exc.value.status_code == 503
+    assert exc.value.retry_after >= 1
+
+
+def test_admit_rejects_with_429_when_queue_is_full():
+    scheduler = make_scheduler(max_queue=0)
+    plan = scheduler.plan_signals(1, 1, 100)
+
+    with scheduler.admit(plan):
+        with pytest.raises(AdmissionRejected) as exc:
+            with scheduler.admit(plan):
+                pass
+
+    assert exc.value.status_code == 429
+
+
+def test_cheapest_waiting_job_is_admitted_first():
+    scheduler = make_scheduler(max_queue=4, queue_timeout=5)
+    small = scheduler.plan_signals(1, 1, 100)
+    large = scheduler.plan_signals(5, 1, 100)
+    order = []
+
+    def run(name, plan):
+        with scheduler.admit(plan):
+            order.append(name)
+
+    with scheduler.admit(small):
+        threads = [
+            threading.Thread(target=run, args=("large", large)),
+            threading.Thread(target=run, args=("small", small)),
+        ]
+        for t in threads:
+            t.start()
+            time.sleep(0.05)
+
+    for t in threads:
+        t.join()
+
+    assert order == ["small", "large"]
+
+
+def test_admit_releases_budget_after_errors():
+    scheduler = make_scheduler()
+    plan = scheduler.plan_signals(1, 1, 100)
+
+    with pytest.raises(RuntimeError):
+        with scheduler.admit(plan):
+            raise RuntimeError("boom")
+
+    with scheduler.admit(plan):
+        pass
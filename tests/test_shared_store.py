@@ -0,0 +1,150 @@
+# tests/test_shared_store.py
+
+import multiprocessing
+import os
+import time
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.services.cache import ResultCache
+from app.services.shared_store import FrameCodec, JsonCodec, SharedStore, TMP_MAX_AGE_SECONDS
+from app.services.synthetic_data import SyntheticMarketDataService
+
+TODAY = date(2026, 1, 6)
+YESTERDAY = date(2026, 1, 5)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SharedStore(str(tmp_path))
+
+
+@pytest.fixture
+def panel():
+    svc = SyntheticMarketDataService(datetime(2025, 1, 1), datetime(2026, 1, 1))
+    return svc._download_panel(["AAPL", "NVDA"])
+
+
+def test_frame_roundtrip_is_read_only_view(store, panel):
+    df = store.get_or_publish((TODAY, "panel"), lambda: panel, FrameCodec)
+
+    assert list(df.columns) == list(panel.columns)
+    assert (df["Date"] == panel["Date"]).all()
+    np.testing.assert_allclose(df["Close_AAPL"], panel["Close_AAPL"])
+    assert not df["Close_AAPL"].to_numpy().flags.writeable
+
+
+def test_json_roundtrip(store):
+    value = [{"ticker": "AAPL", "confidence": 0.25}]
+    assert store.get_or_publish((TODAY, "signals"), lambda: value, JsonCodec) == value
+
+
+def test_published_key_is_not_recomputed(store):
+    store.get_or_publish((TODAY, "x"), lambda: [1], JsonCodec)
+    assert store.get_or_publish((TODAY, "x"), lambda: pytest.fail("recomputed"), JsonCodec) == [1]
+
+
+def _publish_from_worker(directory: str, marker_dir: str) -> list:
+    def loader():
+        # Leave a marker per computation, then hold the lock for a while
+        open(os.path.join(marker_dir, str(os.getpid())), "w").close()
+        time.sleep(0.2)
+        return [42]
+
+    return SharedStore(directory).get_or_publish((TODAY, "shared"), loader, JsonCodec)
+
+
+def test_only_one_process_computes_a_key(tmp_path):
+    directory, markers = tmp_path / "store", tmp_path / "markers"
+    markers.mkdir()
+
+    ctx = multiprocessing.get_context("fork")
+    with ctx.Pool(4) as pool:
+        results = pool.starmap(_publish_from_worker, [(str(directory), str(markers))] * 4)
+
+    assert results == [[42]] * 4
+    assert len(os.listdir(markers)) == 1
+
+
+def test_prune_removes_other_days_and_stale_tmp(store):
+    store.get_or_publish((YESTERDAY, "a"), lambda: [1], JsonCodec)
+    store.get_or_publish((TODAY, "a"), lambda: [2], JsonCodec)
+
+    stale_tmp = os.path.join(store.directory, f"json-{TODAY:%Y%m%d}-dead.123.tmp")
+    fresh_tmp = os.path.join(store.directory, f"json-{TODAY:%Y%m%d}-live.456.tmp")
+    for path in (stale_tmp, fresh_tmp):
+        open(path, "w").close()
+    old = time.time() - TMP_MAX_AGE_SECONDS - 1
+    os.utime(stale_tmp, (old, old))
+
+    store.prune(TODAY)
+
+    names = os.listdir(store.directory)
+    assert not any(f"-{YESTERDAY:%Y%m%d}-" in n for n in names)
+    assert os.path.basename(fresh_tmp) in names
+    assert os.path.basename(stale_tmp) not in names
+    assert store.get_or_publish((TODAY, "a"), lambda: pytest.fail("recomputed"), JsonCodec) == [2]
+
+
+def test_cache_rollover_prunes_shared_segments(store):
+    cache = ResultCache("test", max_entries=8)
+    cache.shared, cache.codec = store, JsonCodec
+
+    cache.get_or_load((YESTERDAY, "a"), lambda: [1])
+    cache.get_or_load((TODAY, "a"), lambda: [2])
+
+    assert not any(f"-{YESTERDAY:%Y%m%d}-" in n for n in os.listdir(store.directory))
+
+
+def _age(path: str, seconds: float) -> None:
+    old = time.time() - seconds
+    os.utime(path, (old, old))
+
+
+def _segments(store: SharedStore) -> list[str]:
+    return sorted(n for n in os.listdir(store.directory) if not n.endswith((".lock", ".tmp")))
+
+
+def test_publish_evicts_oldest_segments_beyond_count(tmp_path):
+    store = SharedStore(str(tmp_path), max_segments=2)
+
+    for i in range(3):
+        store.get_or_publish((TODAY, i), lambda i=i: [i], JsonCodec)
+        _age(store._path((TODAY, i), JsonCodec), 100 - i)
+
+    store.get_or_publish((TODAY, 3), lambda: [3], JsonCodec)
+
+    assert _segments(store) == sorted(
+        os.path.basename(store._path((TODAY, i), JsonCodec)) for i in (2, 3)
+    )
+    assert not os.path.exists(store._path((TODAY, 0), JsonCodec) + ".lock")
+
+
+def test_publish_evicts_beyond_byte_budget(tmp_path, panel):
+    store = SharedStore(str(tmp_path), max_bytes=1)
+
+    df = store.get_or_publish((TODAY, "big"), lambda: panel, FrameCodec)
+    store.get_or_publish((TODAY, "next"), lambda: panel, FrameCodec)
+
+    # The segment just published is always kept, even alone over budget
+    assert _segments(store) == [os.path.basename(store._path((TODAY, "next"), FrameCodec))]
+    # Views attached before eviction stay valid
+    np.testing.assert_allclose(df["Close_AAPL"], panel["Close_AAPL"])
+
+
+def test_failed_loader_lock_files_are_swept(tmp_path):
+    store = SharedStore(str(tmp_path), max_segments=8)
+
+    def fail():
+        raise ValueError("no data")
+
+    with pytest.raises(ValueError):
+        store.get_or_publish((TODAY, "bad"), fail, JsonCodec)
+    lock = store._path((TODAY, "bad"), JsonCodec) + ".lock"
+    _age(lock, TMP_MAX_AGE_SECONDS + 1)
+
+    store.get_or_publish((TODAY, "good"), lambda: [1], JsonCodec)
+
+    assert not os.path.exists(lock)